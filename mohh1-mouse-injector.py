@@ -2,7 +2,12 @@
 import os
 import re
 import struct
-import subprocess
+import ctypes
+import ctypes.util
+import errno
+import glob
+import json
+import select
 import mmap
 import time
 import threading
@@ -13,8 +18,24 @@ from datetime import datetime
 import math
 
 # Import libraries for mouse tracking
-import pyautogui
 from pynput.mouse import Controller as MouseController, Listener
+from Xlib.display import Display
+
+# numba is optional, without it the hot math simply runs in the interpreter
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as is."""
+        def decorator(func):
+            return func
+        return decorator
+
+# evdev is optional, raw input_event structs are decoded by hand without it
+try:
+    import evdev
+except ImportError:
+    evdev = None
 
 def format_size(size_bytes: int) -> str:
     """Format size in bytes to human readable format."""
@@ -35,66 +56,226 @@ def hexdump(data: bytes, address: int = 0) -> str:
     return '\n'.join(result)
 
 TAU = 6.2831853  # 0x40C90FDB
+CAMY_LIMIT = 1.483529806  # Pitch limit (85 degrees) in radians
+ANGLE_EPSILON = 1e-3  # Slack allowed on the pitch range check for float rounding
 
 # PSP game memory addresses (offsets from game_memory_base)
 MOHH1_CAMBASE_PTR = 0xD8361C
 MOHH1_CAMY = 0x188
 MOHH1_CAMX = 0x1A4
 MOHH1_FOV = 0x1E8
+# CAMY, CAMX and FOV all live in one small span, so they are read with a single call
+MOHH1_CAM_SPAN_SIZE = MOHH1_FOV + 4 - MOHH1_CAMY
+
+# Between FOV refreshes only CAMY through CAMX is read
+MOHH1_ANGLE_SPAN_SIZE = MOHH1_CAMX + 4 - MOHH1_CAMY
+
+# How often (seconds) the cached camera base pointer is re-read
+CAM_BASE_REFRESH_INTERVAL = 1.0
+# How many frames the cached FOV is reused before it is read again
+FOV_REFRESH_FRAMES = 10
+# Minimum time (seconds) between two "camera write refused" messages
+REFUSED_WRITE_WARN_INTERVAL = 5.0
+
+# Precompiled little-endian codecs for PSP memory values
+_F32 = struct.Struct('<f')
+_U32 = struct.Struct('<I')
+_U16 = struct.Struct('<H')
+
+# Buffer size for reading /proc/pid/maps; large enough to get it in one read
+MAPS_READ_SIZE = 1 << 20
+
+# File name under which the last found game memory base is remembered between runs
+GAME_MEMORY_CACHE_FILE = "mohh1-inject.cache"
+
+# Upper bound on remote iovecs passed in one process_vm_readv/writev call
+MAX_REMOTE_IOVS = 4
+
+class IOVec(ctypes.Structure):
+    """struct iovec as used by process_vm_readv/process_vm_writev."""
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+def _load_process_vm_calls():
+    """Look up process_vm_readv/process_vm_writev in libc, if available."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        readv = libc.process_vm_readv
+        writev = libc.process_vm_writev
+    except (OSError, AttributeError):
+        return None, None
+    for func in (readv, writev):
+        func.argtypes = [ctypes.c_int, ctypes.POINTER(IOVec), ctypes.c_ulong,
+                         ctypes.POINTER(IOVec), ctypes.c_ulong, ctypes.c_ulong]
+        func.restype = ctypes.c_ssize_t
+    return readv, writev
+
+_process_vm_readv, _process_vm_writev = _load_process_vm_calls()
+
+def buffer_address(buf: bytearray) -> int:
+    """Address of a bytearray's storage, stable for as long as the bytearray is not resized."""
+    return ctypes.addressof((ctypes.c_char * len(buf)).from_buffer(buf))
+
+# Linux input event codes for relative mouse motion (linux/input-event-codes.h)
+EV_REL = 0x02
+REL_X = 0x00
+REL_Y = 0x01
+# struct input_event: struct timeval, __u16 type, __u16 code, __s32 value
+_INPUT_EVENT = struct.Struct('llHHi')
+
+def game_memory_cache_path() -> str:
+    """Per-user location of the game memory cache: $XDG_RUNTIME_DIR, else ~/.cache."""
+    cache_dir = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_dir, GAME_MEMORY_CACHE_FILE)
+
+def find_mouse_device() -> Optional[str]:
+    """Find the evdev node of the mouse, or use PSP_INJECTOR_MOUSE_DEVICE if set."""
+    device = os.environ.get("PSP_INJECTOR_MOUSE_DEVICE")
+    if device:
+        return device
+    devices = sorted(glob.glob("/dev/input/by-id/*-event-mouse"))
+    return devices[0] if devices else None
 
 class MouseTracker:
     def __init__(self):
         self.mouse = MouseController()
         self.prev_x = 0
         self.prev_y = 0
-        self.delta_x = 0
-        self.delta_y = 0
+        # Running motion totals, only ever rebound by the thread producing motion,
+        # so the consumer can diff against what it last saw without a lock
+        self._totals = (0, 0)
+        self._consumed = (0, 0)
         self.is_tracking = False
         self.tracking_thread = None
         self.mouse_listener = None
-        self.lock = threading.Lock()
+        self.input_device = None  # evdev InputDevice, when the evdev package is installed
+        self.input_fd = None  # Raw /dev/input/event* descriptor otherwise
+        # Set by on_move so the main loop can sleep while the mouse is idle
+        self._delta_event = threading.Event()
         # Center the mouse when starting
-        self.screen_width, self.screen_height = pyautogui.size()
+        self.display = None
+        self.screen_width, self.screen_height = self._get_screen_size()
         self.center_x = self.screen_width // 2
         self.center_y = self.screen_height // 2
         self.cursor_hidden = False
         
+    def _get_screen_size(self) -> Tuple[int, int]:
+        """Query the screen size from X once, falling back to PSP_INJECTOR_SCREEN_WIDTH/HEIGHT."""
+        try:
+            self.display = Display()
+            screen = self.display.screen()
+            return screen.width_in_pixels, screen.height_in_pixels
+        except Exception as e:
+            print(f"Could not query screen size from X: {e}")
+            return (int(os.environ.get("PSP_INJECTOR_SCREEN_WIDTH", "1920")),
+                    int(os.environ.get("PSP_INJECTOR_SCREEN_HEIGHT", "1080")))
+
     def hide_cursor(self):
-        """Try to hide the cursor using platform-specific methods."""
-        # Only attempt on Linux
-        if sys.platform.startswith('linux'):
-            try:
-                # Use xdotool to hide cursor
-                subprocess.run(["xdotool", "mousemove_relative", "--sync", "--", "0", "0"], 
-                               stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
-                self.cursor_hidden = True
-                print("Cursor hidden")
-            except (subprocess.SubprocessError, FileNotFoundError):
-                print("Could not hide cursor. Install xdotool for better experience.")
+        """Hide the cursor over the root window using the XFixes extension."""
+        if not self.display or not self.display.has_extension('XFIXES'):
+            print("Could not hide cursor: XFixes extension not available.")
+            return
+        try:
+            self.display.xfixes_query_version()
+            self.display.screen().root.xfixes_hide_cursor()
+            self.display.sync()
+            self.cursor_hidden = True
+            print("Cursor hidden")
+        except Exception as e:
+            print(f"Could not hide cursor: {e}")
         
     def show_cursor(self):
         """Show the cursor if it was hidden."""
-        if self.cursor_hidden and sys.platform.startswith('linux'):
+        if self.cursor_hidden and self.display:
             try:
-                # Use xdotool to show cursor
-                subprocess.run(["xdotool", "mousemove_relative", "--sync", "--", "0", "0"], 
-                               stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+                self.display.screen().root.xfixes_show_cursor()
+                self.display.sync()
                 self.cursor_hidden = False
                 print("Cursor visible again")
-            except (subprocess.SubprocessError, FileNotFoundError):
+            except Exception:
                 pass
         
     def on_move(self, x, y):
         """Callback for mouse movement."""
-        with self.lock:
-            # Calculate relative movement from the previous position
-            self.delta_x += x - self.prev_x
-            self.delta_y += y - self.prev_y
-            self.prev_x = x
-            self.prev_y = y
+        # Calculate relative movement from the previous position
+        total_x, total_y = self._totals
+        self._totals = (total_x + x - self.prev_x, total_y + y - self.prev_y)
+        self.prev_x = x
+        self.prev_y = y
+        self._delta_event.set()
+
+    def _open_input_device(self, path: str) -> bool:
+        """Open the evdev mouse node for reading. Returns False if it can't be opened."""
+        try:
+            if evdev:
+                self.input_device = evdev.InputDevice(path)
+                self.input_fd = self.input_device.fd
+            else:
+                self.input_fd = os.open(path, os.O_RDONLY)
+        except OSError as e:
+            print(f"Could not open {path}: {e}. Falling back to X pointer tracking.")
+            self.input_device = None
+            self.input_fd = None
+            return False
+        print(f"Reading relative mouse motion from {path}")
+        return True
+
+    def _read_input_events(self):
+        """Accumulate REL_X/REL_Y straight from the kernel until tracking stops."""
+        fd = self.input_fd
+        while self.is_tracking:
+            # Time out regularly so stop_tracking is noticed
+            ready, _, _ = select.select([fd], [], [], 0.1)
+            if not ready:
+                continue
+            try:
+                if self.input_device:
+                    events = [(e.type, e.code, e.value) for e in self.input_device.read()]
+                else:
+                    data = os.read(fd, _INPUT_EVENT.size * 64)
+                    events = [(t, c, v) for _, _, t, c, v in _INPUT_EVENT.iter_unpack(data)]
+            except (BlockingIOError, InterruptedError):
+                # Spurious wakeup, nothing to read after all
+                continue
+            except OSError as e:
+                # e.g. ENODEV when the mouse is unplugged: keep tracking through X instead
+                print(f"Error reading mouse device: {e}. Falling back to X pointer tracking.")
+                self._close_input_device()
+                if self.is_tracking:
+                    self._start_listener()
+                return
+
+            dx = dy = 0
+            for ev_type, code, value in events:
+                if ev_type == EV_REL:
+                    if code == REL_X:
+                        dx += value
+                    elif code == REL_Y:
+                        dy += value
+            if dx or dy:
+                total_x, total_y = self._totals
+                self._totals = (total_x + dx, total_y + dy)
+                self._delta_event.set()
+
+    def _close_input_device(self):
+        """Close the evdev mouse node, if open."""
+        if self.input_device:
+            self.input_device.close()
+        elif self.input_fd is not None:
+            os.close(self.input_fd)
+        self.input_device = None
+        self.input_fd = None
+
+    def _start_listener(self):
+        """Track the X pointer through a pynput listener."""
+        # Initialize position
+        self.prev_x, self.prev_y = self.mouse.position
+        
+        # Start mouse listener
+        self.mouse_listener = Listener(on_move=self.on_move)
+        self.mouse_listener.start()
 
     def start_tracking(self):
-        """Start tracking mouse movements using a listener."""
+        """Start tracking mouse movements, from evdev if possible or else using a listener."""
         if self.is_tracking:
             return
             
@@ -103,12 +284,13 @@ class MouseTracker:
         # Try to hide the cursor
         self.hide_cursor()
         
-        # Initialize position
-        self.prev_x, self.prev_y = self.mouse.position
-        
-        # Start mouse listener
-        self.mouse_listener = Listener(on_move=self.on_move)
-        self.mouse_listener.start()
+        device = find_mouse_device()
+        if device and self._open_input_device(device):
+            # The kernel already delivers relative deltas, no X round-trips needed
+            self.tracking_thread = threading.Thread(target=self._read_input_events, daemon=True)
+            self.tracking_thread.start()
+        else:
+            self._start_listener()
         
         print("Mouse tracking started. Move your mouse to control the game camera.")
         
@@ -119,62 +301,198 @@ class MouseTracker:
         # Show the cursor again
         self.show_cursor()
         
+        # Stop the evdev reader first, it may have switched over to the listener
+        if self.tracking_thread:
+            self.tracking_thread.join()
+            self.tracking_thread = None
+        self._close_input_device()
+
         # Stop the mouse listener
         if self.mouse_listener:
             self.mouse_listener.stop()
             self.mouse_listener = None
+
+        # Closing the connection also drops any cursor hide held by it
+        if self.display:
+            self.display.close()
+            self.display = None
         
+    def wait_for_movement(self, timeout: float) -> bool:
+        """Block until the mouse moves or the timeout expires. Returns True if it moved."""
+        moved = self._delta_event.wait(timeout)
+        self._delta_event.clear()
+        return moved
+
     def get_and_reset_deltas(self):
         """Get the current movement deltas and reset them."""
-        with self.lock:
-            dx, dy = self.delta_x, self.delta_y
-            self.delta_x = 0
-            self.delta_y = 0
-        return dx, dy
+        # Rebinding a tuple attribute is atomic under the GIL
+        totals = self._totals
+        consumed_x, consumed_y = self._consumed
+        self._consumed = totals
+        return totals[0] - consumed_x, totals[1] - consumed_y
 
 class ProcessMemory:
     def __init__(self, process_names: List[str]):
         self.process_names = process_names
         self.process_name = None  # The actual detected process name
         self.pid = self._find_pid()
-        self.mem_file = None
-        self.maps_file = None
+        self.mem_fd = None
         self.game_memory_base = None  # Base address for game memory
-        if self.pid:
-            self.mem_file = open(f"/proc/{self.pid}/mem", "rb+")
-            self.maps_file = open(f"/proc/{self.pid}/maps", "r")
+        self.game_memory_size = 0  # Size of the game memory region
+        self._status_buf = None  # Snapshot of game memory used by psp_mohh1_status
+        # Use process_vm_readv/writev when available; /proc/pid/mem is only a fallback
+        self.use_vm_calls = _process_vm_readv is not None
+        self._local_iov = IOVec()
+        self._local_iov_ref = ctypes.byref(self._local_iov)
+        self._remote_iovs = (IOVec * MAX_REMOTE_IOVS)()
+        # Reused buffer holding the camera fields from CAMY up to and including FOV
+        self._cam_buf = bytearray(MOHH1_CAM_SPAN_SIZE)
+        self._cam_buf_address = buffer_address(self._cam_buf)
+        # Cached camera base pointer and when it must be re-read
+        self._cam_base = 0
+        self._cam_base_expiry = 0.0
+        # Cached FOV and how many more frames it may be reused for
+        self._fov = 0.0
+        self._fov_ttl = 0
+        # When a refused camera write was last reported
+        self._refused_warn_time = float('-inf')
+        # Reused buffer for the CAMX/CAMY pair written back each frame
+        self._cam_out_buf = bytearray(8)
+        self._cam_out_buf_address = buffer_address(self._cam_out_buf)
+        # Reused buffer for small typed reads (read_uint32, read_float, ...)
+        self._rd_buf = bytearray(64)
+        self._rd_buf_address = buffer_address(self._rd_buf)
+        if self.pid and not self.use_vm_calls:
+            self._open_mem_fd()
+
+    def _open_mem_fd(self) -> None:
+        """Open /proc/pid/mem for the pread/pwrite fallback path."""
+        if self.mem_fd is None:
+            # /proc/pid/mem can't be mmap'ed (ENODEV); a raw descriptor with
+            # pread/pwrite gives one unbuffered syscall per access, no seek needed
+            self.mem_fd = os.open(f"/proc/{self.pid}/mem", os.O_RDWR)
+
+    def _vm_transfer(self, func, local_address: int, local_size: int, remote: List[Tuple[int, int]]) -> int:
+        """Run process_vm_readv/writev moving local_size bytes at local_address to/from the given (address, size) ranges."""
+        self._local_iov.iov_base = local_address
+        self._local_iov.iov_len = local_size
+        for i, (address, size) in enumerate(remote):
+            self._remote_iovs[i].iov_base = address
+            self._remote_iovs[i].iov_len = size
+        result = func(self.pid, self._local_iov_ref, 1,
+                      self._remote_iovs, len(remote), 0)
+        if result < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EPERM, errno.ENOSYS):
+                # Not allowed (or not supported) here, switch to /proc/pid/mem for good
+                print("process_vm_readv/writev unavailable, falling back to /proc/pid/mem")
+                self.use_vm_calls = False
+                self._open_mem_fd()
+                return -1
+            raise OSError(err, os.strerror(err))
+        return result
     
     def _find_pid(self) -> Optional[int]:
         """Find the process ID of any of the given process names."""
-        for process_name in self.process_names:
+        # Read every command line once (like pgrep -f), then try the names in order
+        cmdlines = []
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit() or int(entry) == os.getpid():
+                continue
             try:
-                output = subprocess.check_output(["pgrep", "-f", process_name])
-                pid = int(output.decode().strip())
-                self.process_name = process_name
-                print(f"Found PPSSPP process '{process_name}' with PID: {pid}")
-                return pid
-            except subprocess.CalledProcessError:
+                with open(f"/proc/{entry}/cmdline", "rb") as f:
+                    cmdline = f.read().replace(b"\0", b" ").decode(errors="replace")
+            except OSError:
+                # The process exited or isn't ours to look at
                 continue
+            cmdlines.append((int(entry), cmdline))
+        cmdlines.sort()
+
+        for process_name in self.process_names:
+            for pid, cmdline in cmdlines:
+                if process_name in cmdline:
+                    self.process_name = process_name
+                    print(f"Found PPSSPP process '{process_name}' with PID: {pid}")
+                    return pid
                 
         print(f"No PPSSPP process found. Tried: {', '.join(self.process_names)}")
         return None
     
     def read_memory(self, address: int, size: int) -> bytes:
         """Read memory at the given address."""
-        if not self.mem_file:
+        if not self.pid:
             raise RuntimeError("Process not found or memory file not opened")
-        
-        self.mem_file.seek(address)
-        return self.mem_file.read(size)
+
+        if self.use_vm_calls:
+            buf = bytearray(size)
+            result = self._vm_transfer(_process_vm_readv, buffer_address(buf), size, [(address, size)])
+            if result >= 0:
+                return bytes(buf[:result])
+
+        return os.pread(self.mem_fd, size, address)
     
     def write_memory(self, address: int, data: bytes) -> None:
         """Write data to memory at the given address."""
-        if not self.mem_file:
+        if not self.pid:
             raise RuntimeError("Process not found or memory file not opened")
-        
-        self.mem_file.seek(address)
-        self.mem_file.write(data)
+
+        if self.use_vm_calls:
+            buf = data if isinstance(data, bytearray) else bytearray(data)
+            if self._vm_transfer(_process_vm_writev, buffer_address(buf), len(buf), [(address, len(buf))]) >= 0:
+                return
+
+        os.pwrite(self.mem_fd, data, address)
     
+    def read_memory_into(self, address: int, buf: bytearray, size: Optional[int] = None,
+                         buf_address: Optional[int] = None) -> int:
+        """Read size (default len(buf)) bytes at the given address into the start of buf, returning the number of bytes read.
+
+        Pass buf_address (from buffer_address()) for a long-lived buffer to skip looking it up on every call.
+        """
+        if not self.pid:
+            raise RuntimeError("Process not found or memory file not opened")
+
+        if size is None:
+            size = len(buf)
+        elif not 0 <= size <= len(buf):
+            # The kernel would write past the end of buf otherwise
+            raise ValueError(f"Read of {size} bytes doesn't fit in a {len(buf)}-byte buffer")
+        if self.use_vm_calls:
+            if buf_address is None:
+                buf_address = buffer_address(buf)
+            result = self._vm_transfer(_process_vm_readv, buf_address, size, [(address, size)])
+            if result >= 0:
+                return result
+
+        return os.preadv(self.mem_fd, [memoryview(buf)[:size]], address)
+
+    def read_into(self, address: int, size: int) -> bytearray:
+        """Read size bytes into the shared read buffer and return it; valid until the next read_into."""
+        if self.read_memory_into(address, self._rd_buf, size, self._rd_buf_address) != size:
+            raise OSError(errno.EIO, f"Short read at 0x{address:X}")
+        return self._rd_buf
+
+    def write_memory_gather(self, buf: bytearray, remote: List[Tuple[int, int]],
+                            buf_address: Optional[int] = None) -> None:
+        """Write buf out across the (address, size) ranges, in a single process_vm_writev call when possible."""
+        if not self.pid:
+            raise RuntimeError("Process not found or memory file not opened")
+
+        total = sum(size for _, size in remote)
+        if total > len(buf):
+            # The kernel would read past the end of buf otherwise
+            raise ValueError(f"Write of {total} bytes doesn't fit in a {len(buf)}-byte buffer")
+        if self.use_vm_calls:
+            if buf_address is None:
+                buf_address = buffer_address(buf)
+            if self._vm_transfer(_process_vm_writev, buf_address, total, remote) >= 0:
+                return
+
+        offset = 0
+        for address, size in remote:
+            os.pwrite(self.mem_fd, buf[offset:offset + size], address)
+            offset += size
+
     def read_int(self, address: int, size: int = 4) -> int:
         """Read an integer from memory."""
         data = self.read_memory(address, size)
@@ -185,6 +503,20 @@ class ProcessMemory:
         data = value.to_bytes(size, byteorder='little')
         self.write_memory(address, data)
     
+    def _read_maps(self) -> str:
+        """Read /proc/pid/maps with as few read() calls as possible so the snapshot is consistent."""
+        fd = os.open(f"/proc/{self.pid}/maps", os.O_RDONLY)
+        try:
+            chunks = []
+            while True:
+                chunk = os.read(fd, MAPS_READ_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+        return b''.join(chunks).decode(errors='replace')
+
     def dump_memory_region(self, start: int, size: int, filename: str) -> None:
         """Dump a memory region to a file in binary format."""
         try:
@@ -195,28 +527,76 @@ class ProcessMemory:
         except Exception as e:
             print(f"Error dumping memory: {e}")
     
+    def _process_ctime(self) -> float:
+        """ctime of /proc/pid, which tells apart processes that reused the same PID."""
+        return os.stat(f"/proc/{self.pid}").st_ctime
+
+    def _load_cached_game_memory(self) -> Optional[int]:
+        """Return the cached game memory base if it belongs to this process and still looks valid."""
+        try:
+            with open(game_memory_cache_path()) as f:
+                # Only trust a cache written by ourselves, its base address decides where we write
+                if os.fstat(f.fileno()).st_uid != os.getuid():
+                    return None
+                cache = json.load(f)
+            if cache["pid"] != self.pid or cache["ctime"] != self._process_ctime():
+                return None
+            base, size = cache["base"], cache["size"]
+            if type(base) is not int or type(size) is not int or base <= 0 or size <= 0:
+                return None
+            # Same signature check as the full scan, but for a single address
+            test_data = self.read_memory(base, 4)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if len(test_data) < 2 or test_data[0] == 0 or test_data[1] == 0:
+            return None
+
+        print(f"Using cached game memory region at 0x{base:08X}")
+        self.game_memory_base = base
+        self.game_memory_size = size
+        return base
+
+    def _save_cached_game_memory(self) -> None:
+        """Remember the game memory region found for this process."""
+        path = game_memory_cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            # Replace rather than reuse any existing file, so it ends up owned by us and private
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            with open(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "w") as f:
+                json.dump({"pid": self.pid, "ctime": self._process_ctime(),
+                           "base": self.game_memory_base, "size": self.game_memory_size}, f)
+        except OSError as e:
+            print(f"Could not write {path}: {e}")
+
     def find_game_memory(self) -> Optional[int]:
         """Scan memory regions to find the game memory offset."""
-        if not self.maps_file:
+        if not self.pid:
             return None
+
+        # Skip the scan if the same process was already scanned on a previous run
+        cached_base = self._load_cached_game_memory()
+        if cached_base:
+            return cached_base
             
         # PSP game memory is typically around 32MB
         TARGET_SIZE = 32 * 1024 * 1024  # 32MB in bytes
         SIZE_TOLERANCE = 0.1  # 10% tolerance for size matching
-        MIN_SIZE = 1 * 1024 * 1024  # Minimum size of 1MB
         
-        # Read memory maps
-        maps_content = self.maps_file.read()
-        self.maps_file.seek(0)
-        
-        regions = []
         print("Scanning memory regions...")
         
-        # First pass: collect all relevant regions
-        for line in self.maps_file:
-            parts = line.split()
+        # Single pass over the maps, stopping at the first region that looks like game memory
+        for line in self._read_maps().splitlines():
+            parts = line.split(None, 5)
             if len(parts) < 6:
                 continue
+
+            # Game memory is read-write
+            if not parts[1].startswith('rw'):
+                continue
                 
             # Parse memory range
             addr_range = parts[0].split('-')
@@ -224,100 +604,66 @@ class ProcessMemory:
                 continue
                 
             start_addr = int(addr_range[0], 16)
-            end_addr = int(addr_range[1], 16)
-            region_size = end_addr - start_addr
+            region_size = int(addr_range[1], 16) - start_addr
+
+            # Check if region size is close to 32MB
+            if abs(region_size - TARGET_SIZE) > TARGET_SIZE * SIZE_TOLERANCE:
+                continue
+
+            print(f"\nFound potential game memory region (close to 32MB):")
+            print(f"Address: 0x{start_addr:08X} Size: {format_size(region_size)} ({hex(region_size)})")
             
-            # Store region info for debugging
-            regions.append({
-                'start': start_addr,
-                'size': region_size,
-                'perms': parts[1],
-                'path': parts[-1] if len(parts) > 5 else ''
-            })
-        
-        # Second pass: look for game memory
-        for i, region in enumerate(regions):
-            if region['size'] >= MIN_SIZE:  # Read-write, private, and at least 1MB
-                # Check if region size is close to 32MB
-                size_diff = abs(region['size'] - TARGET_SIZE) / TARGET_SIZE
-                if size_diff <= SIZE_TOLERANCE:
-                    print(f"\nFound potential game memory region (close to 32MB):")
-                    print(f"Address: 0x{region['start']:08X} Size: {format_size(region['size'])} ({hex(region['size'])})")
-                    
-                    # Verify this is actually game memory by checking for non-zero content
-                    try:
-                        # Read first few bytes to verify
-                        test_data = self.read_memory(region['start'], 4)
-                        if any(test_data):  # If any bytes are non-zero
-                            print(f"Found non-zero content at: 0x{region['start']:08X}")
-                            print(f"First 4 bytes: {test_data.hex()}")
-                            
-                            # Additional verification: check for PSP memory signature
-                            if test_data[0] != 0 and test_data[1] != 0:
-                                print("Found potential PSP memory signature")
-                                self.game_memory_base = region['start']
-                                return region['start']
-                    except Exception as e:
-                        print(f"Error reading memory: {e}")
-                        continue
+            # Verify this is actually game memory by checking for a PSP memory signature
+            try:
+                test_data = self.read_memory(start_addr, 4)
+            except Exception as e:
+                print(f"Error reading memory: {e}")
+                continue
+            if len(test_data) >= 2 and test_data[0] != 0 and test_data[1] != 0:
+                print(f"Found potential PSP memory signature, first 4 bytes: {test_data.hex()}")
+                self.game_memory_base = start_addr
+                self.game_memory_size = region_size
+                self._save_cached_game_memory()
+                return start_addr
         
         print("\nNo suitable game memory region found.")
         return None
     
     def close(self):
-        """Close the memory files."""
-        if self.mem_file:
-            self.mem_file.close()
-            self.mem_file = None
-        if self.maps_file:
-            self.maps_file.close()
-            self.maps_file = None
+        """Close the memory file."""
+        if self.mem_fd is not None:
+            os.close(self.mem_fd)
+            self.mem_fd = None
 
     # PSP memory read/write functions that use the game memory base
     def read_uint32(self, address: int) -> int:
         """Read a 32-bit unsigned integer from game memory (address is offset from game_memory_base)."""
-        if not self.game_memory_base:
-            print("Error: Game memory base not established. Call find_game_memory() first.")
-            return 0
-        return self.read_int(self.game_memory_base + address, size=4)
+        assert self.game_memory_base, "Game memory base not established. Call find_game_memory() first."
+        return _U32.unpack_from(self.read_into(self.game_memory_base + address, 4))[0]
 
     def read_uint16(self, address: int) -> int:
         """Read a 16-bit unsigned integer from game memory."""
-        if not self.game_memory_base:
-            print("Error: Game memory base not established. Call find_game_memory() first.")
-            return 0
-        data = self.read_memory(self.game_memory_base + address, size=2)
-        return int.from_bytes(data, byteorder='little')
+        assert self.game_memory_base, "Game memory base not established. Call find_game_memory() first."
+        return _U16.unpack_from(self.read_into(self.game_memory_base + address, 2))[0]
 
     def read_float(self, address: int) -> float:
         """Read a float from game memory."""
-        if not self.game_memory_base:
-            print("Error: Game memory base not established. Call find_game_memory() first.")
-            return 0.0
-        data = self.read_memory(self.game_memory_base + address, size=4)
-        return struct.unpack('f', data)[0]
+        assert self.game_memory_base, "Game memory base not established. Call find_game_memory() first."
+        return _F32.unpack_from(self.read_into(self.game_memory_base + address, 4))[0]
 
     def write_uint16(self, address: int, value: int) -> None:
         """Write a 16-bit unsigned integer to game memory."""
-        if not self.game_memory_base:
-            print("Error: Game memory base not established. Call find_game_memory() first.")
-            return
-        data = value.to_bytes(2, byteorder='little')
-        self.write_memory(self.game_memory_base + address, data)
+        assert self.game_memory_base, "Game memory base not established. Call find_game_memory() first."
+        self.write_memory(self.game_memory_base + address, _U16.pack(value))
 
     def write_float(self, address: int, value: float) -> None:
         """Write a float to game memory."""
-        if not self.game_memory_base:
-            print("Error: Game memory base not established. Call find_game_memory() first.")
-            return
-        data = struct.pack('f', value)
-        self.write_memory(self.game_memory_base + address, data)
+        assert self.game_memory_base, "Game memory base not established. Call find_game_memory() first."
+        self.write_memory(self.game_memory_base + address, _F32.pack(value))
 
     def read_pointer(self, address: int) -> int:
         """Read a pointer from game memory and adjust it."""
-        if not self.game_memory_base:
-            print("Error: Game memory base not established. Call find_game_memory() first.")
-            return 0
+        assert self.game_memory_base, "Game memory base not established. Call find_game_memory() first."
         # Equivalent to PSP_MEM_ReadPointer in C code
         val = self.read_uint32(address)
         if val:
@@ -325,56 +671,116 @@ class ProcessMemory:
         return 0
 
     def psp_mohh1_status(self) -> bool:
-        # check if ULUS-1014 is anywhere in the process memory
-        for i in range(0, 0x10000000, 0x1000):
-            if self.read_memory(i, 8) == b'ULUS-1014':
-                return True
-        return False
-        
-    def psp_mohh1_inject(self, xmouse: float, ymouse: float, sensitivity: float, invertpitch: bool) -> None:
-        """Calculate mouse look and inject into the current game."""
+        """Check if ULUS-1014 is anywhere in game memory. Reads the whole region at once, so call on demand only."""
         if not self.game_memory_base:
             print("Error: Game memory base not established. Call find_game_memory() first.")
-            return
+            return False
+        if self._status_buf is None or len(self._status_buf) != self.game_memory_size:
+            self._status_buf = bytearray(self.game_memory_size)
+        size = self.read_memory_into(self.game_memory_base, self._status_buf)
+        return self._status_buf.find(b'ULUS-1014', 0, size) != -1
         
-        # Read the camera base pointer
-        cam_base = self.read_pointer(MOHH1_CAMBASE_PTR)
-        if not cam_base:
-            return
+    def _refuse_camera_write(self, reason: str, now: float) -> None:
+        """Report (at most every REFUSED_WRITE_WARN_INTERVAL seconds) that camera data looked bogus."""
+        if now - self._refused_warn_time >= REFUSED_WRITE_WARN_INTERVAL:
+            self._refused_warn_time = now
+            print(f"Camera data looks invalid ({reason}), not writing; re-reading the camera pointer")
 
-        # Read current FOV and adjust if necessary
-        fov = self.read_float(cam_base + MOHH1_FOV)
-        # if fov == 30:
-        #     self.write_float(cam_base + MOHH1_FOV, 42.0)
+    def psp_mohh1_inject(self, xmouse: float, ymouse: float, look_scale: float, ypitch_sign: float) -> None:
+        """Calculate mouse look and inject into the current game.
 
+        look_scale and ypitch_sign come from mohh1_look_params(), computed once instead of per frame.
+        """
         # If mouse is not moving, don't do anything
         if xmouse == 0 and ymouse == 0:  
             return
 
-        # Read current camera angles
-        cam_x = self.read_float(cam_base + MOHH1_CAMX)
-        cam_y = self.read_float(cam_base + MOHH1_CAMY)
+        # Hot path: look attributes up once
+        base = self.game_memory_base
+        assert base, "Game memory base not established. Call find_game_memory() first."
+
+        # The camera base pointer rarely changes, so only re-read it periodically
+        now = time.monotonic()
+        cam_base = self._cam_base
+        if not cam_base or now >= self._cam_base_expiry:
+            cam_base = self.read_pointer(MOHH1_CAMBASE_PTR)
+            if not cam_base:
+                return
+            self._cam_base_expiry = now + CAM_BASE_REFRESH_INTERVAL
+            # A new pointer may mean a new camera, so re-read its FOV as well
+            self._fov_ttl = 0
+        # Drop the cached pointer unless the camera data read below looks sane
+        self._cam_base = 0
+
+        # Read current camera angles, plus the FOV (which rarely changes) every few frames.
+        # The FOV check only runs on those frames, the angle check below runs on every one.
+        cam_buf = self._cam_buf
+        cam_addr = base + cam_base
+        size = MOHH1_CAM_SPAN_SIZE if self._fov_ttl <= 0 else MOHH1_ANGLE_SPAN_SIZE
+        if self.read_memory_into(cam_addr + MOHH1_CAMY, cam_buf, size, self._cam_buf_address) != size:
+            return
+        if size == MOHH1_CAM_SPAN_SIZE:
+            fov = _F32.unpack_from(cam_buf, MOHH1_FOV - MOHH1_CAMY)[0]
+            if math.isnan(fov) or fov <= 0:
+                self._refuse_camera_write(f"FOV {fov}", now)
+                return
+            self._fov = fov
+            self._fov_ttl = FOV_REFRESH_FRAMES
+        else:
+            fov = self._fov
+            self._fov_ttl -= 1
+        # if fov == 30:
+        #     self.write_float(cam_base + MOHH1_FOV, 42.0)
+        cam_x = _F32.unpack_from(cam_buf, MOHH1_CAMX - MOHH1_CAMY)[0]
+        cam_y = _F32.unpack_from(cam_buf, 0)[0]
+
+        # Angles the game itself would never hold mean the pointer is stale: don't write,
+        # and don't trust the FOV cached from it either. Yaw isn't range checked since the
+        # game doesn't keep it wrapped; mohh1_update_angles normalises any finite value.
+        if not (math.isfinite(cam_x) and abs(cam_y) <= CAMY_LIMIT + ANGLE_EPSILON):
+            self._fov_ttl = 0
+            self._refuse_camera_write(f"angles ({cam_x}, {cam_y})", now)
+            return
+        self._cam_base = cam_base
 
         # Calculate new camera angles based on mouse movement
-        look_sensitivity = sensitivity / 20.0
-        scale = 20000.0
-
-        cam_x -= (xmouse * look_sensitivity / scale * fov)
-        cam_y -= (ymouse * look_sensitivity / scale * fov) if not invertpitch else (-ymouse * look_sensitivity / scale * fov)
-
-        # Adjust camera angles to stay within bounds
-        # Equivalent to the while loops in C code for X axis
-        while cam_x > TAU / 2:
-            cam_x -= TAU
-        while cam_x < -TAU / 2:
-            cam_x += TAU
-            
-        # Clamp Y axis
-        cam_y = max(min(cam_y, 1.483529806), -1.483529806)
+        cam_x, cam_y = mohh1_update_angles(cam_x, cam_y, fov, xmouse, ymouse, look_scale, ypitch_sign)
 
         # Write the new camera angles
-        self.write_float(cam_base + MOHH1_CAMX, cam_x)
-        self.write_float(cam_base + MOHH1_CAMY, cam_y)
+        out_buf = self._cam_out_buf
+        _F32.pack_into(out_buf, 0, cam_x)
+        _F32.pack_into(out_buf, 4, cam_y)
+        self.write_memory_gather(out_buf, [
+            (cam_addr + MOHH1_CAMX, 4),
+            (cam_addr + MOHH1_CAMY, 4),
+        ], self._cam_out_buf_address)
+
+@njit(cache=True)
+def mohh1_update_angles(cam_x: float, cam_y: float, fov: float, xmouse: float, ymouse: float,
+                        look_scale: float, ypitch_sign: float) -> Tuple[float, float]:
+    """Apply mouse movement to the camera angles, compiled with numba when it is installed."""
+    step = look_scale * fov
+    cam_x -= xmouse * step
+    cam_y -= ymouse * step * ypitch_sign
+
+    # Adjust camera angles to stay within bounds
+    # Wraps X into [-TAU/2, TAU/2) like the while loops in the C code
+    # (numba has no math.remainder on the CPU; float modulo also lets NaN/inf through)
+    cam_x = (cam_x + TAU / 2) % TAU - TAU / 2
+
+    # Clamp Y axis
+    if cam_y > CAMY_LIMIT:
+        cam_y = CAMY_LIMIT
+    elif cam_y < -CAMY_LIMIT:
+        cam_y = -CAMY_LIMIT
+    return cam_x, cam_y
+
+def mohh1_look_params(sensitivity: float, invertpitch: bool) -> Tuple[float, float]:
+    """Precompute the angle scale factor and pitch sign passed to psp_mohh1_inject."""
+    # Same as the C code's (sensitivity / 20.0) / 20000.0, folded into a single factor
+    look_scale = sensitivity / (20.0 * 20000.0)
+    ypitch_sign = -1.0 if invertpitch else 1.0
+    return look_scale, ypitch_sign
 
 def signal_handler(sig, frame):
     """Handle Ctrl+C to stop the script gracefully."""
@@ -392,7 +798,8 @@ def main():
     invertpitch = False
     # List of PPSSPP process names to try
     ppsspp_process_names = ["PPSSPPSDL", "PPSSPPQt", "ppsspp"]
-    update_rate = 0.01  # 100 Hz update rate
+    min_inject_interval = 0.002  # Inject at most every 2 ms (500 Hz) while the mouse moves
+    idle_timeout = 0.05  # How long to wait for mouse movement before checking again
     
     # Start mouse tracker
     mouse_tracker = MouseTracker()
@@ -414,6 +821,11 @@ def main():
         print(f"\nFound game memory at offset: 0x{game_memory_offset:08X}")
         print("Starting mouse tracker...")
         
+        look_scale, ypitch_sign = mohh1_look_params(sensitivity, invertpitch)
+        # With numba, compile (or load from cache) now rather than on the first mouse movement;
+        # the argument types match the main loop's (float angles, int deltas)
+        mohh1_update_angles(0.0, 0.0, 1.0, 0, 0, look_scale, ypitch_sign)
+
         # Start tracking mouse movements
         mouse_tracker.start_tracking()
         
@@ -422,18 +834,27 @@ def main():
         running = True
         print("Mouse injector running! Press Ctrl+C to exit.")
         
+        next_inject = 0.0
         while running:
             try:
+                # Sleep until the mouse moves; the timeout only lets us notice shutdown
+                if not mouse_tracker.wait_for_movement(idle_timeout):
+                    continue
+
+                # Inject right away unless the last injection was too recent,
+                # in which case let movement accumulate until the deadline
+                remaining = next_inject - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+
                 # Get mouse movement deltas
                 dx, dy = mouse_tracker.get_and_reset_deltas()
                 
                 # Only inject if there's actual movement
                 if dx != 0 or dy != 0:
                     # Inject mouse movement into game
-                    process.psp_mohh1_inject(dx, dy, sensitivity, invertpitch)
-                
-                # Small sleep to prevent high CPU usage
-                time.sleep(update_rate)
+                    process.psp_mohh1_inject(dx, dy, look_scale, ypitch_sign)
+                next_inject = time.monotonic() + min_inject_interval
                 
             except Exception as e:
                 print(f"Error in main loop: {e}")